@@ -7,6 +7,8 @@ import subprocess
 import os
 import time
 import sys
+import gzip
+import tempfile
 from pathlib import Path
 
 class EmployeeRosterTester:
@@ -24,9 +26,12 @@ class EmployeeRosterTester:
                 except:
                     pass
                     
-    def run_test_scenario(self, scenario_name, inputs, expected_files=None):
+    def run_test_scenario(self, scenario_name, inputs, expected_files=None,
+                          expected_lines=(), unexpected_lines=(), args=(), script='employee_roster.py'):
         """
         Run a test scenario with given inputs and check results.
+        expected_lines must all appear in the output; unexpected_lines must not.
+        args are passed on the command line (e.g. --backend sqlite).
         """
         print(f"\n{'='*60}")
         print(f"TEST SCENARIO: {scenario_name}")
@@ -38,9 +43,11 @@ class EmployeeRosterTester:
         try:
             # Run the main program with input
             result = subprocess.run(
-                [sys.executable, 'employee_roster.py'],
+                [sys.executable, script, *args],
                 input=input_data,
                 text=True,
+                encoding='utf-8',
+                env={**os.environ, 'PYTHONIOENCODING': 'utf-8'},
                 capture_output=True,
                 timeout=30
             )
@@ -75,6 +82,18 @@ class EmployeeRosterTester:
             
             # Record test result
             test_passed = result.returncode in [0, 130]  # 130 is Ctrl+C exit
+            
+            if expected_lines or unexpected_lines:
+                print("OUTPUT VERIFICATION:")
+                print("-" * 40)
+                for line in expected_lines:
+                    found = line in result.stdout
+                    test_passed = test_passed and found
+                    print(f"{'✓' if found else '✗'} Expected: {line}")
+                for line in unexpected_lines:
+                    found = line in result.stdout
+                    test_passed = test_passed and not found
+                    print(f"{'✗' if found else '✓'} Not expected: {line}")
             self.test_results.append({
                 'scenario': scenario_name,
                 'passed': test_passed,
@@ -235,6 +254,262 @@ class EmployeeRosterTester:
             expected_files=["employees_hr.txt"]
         )
         
+        # Test 9: Compressed roster with non-ASCII names
+        gz_roster = self.data_dir / "employees_research.txt.gz"
+        with gzip.open(gz_roster, 'wt', encoding='utf-8') as f:
+            f.write("Zoë,Núñez,RD001,Senior\nJosé,Ångström,RD002,Entry\n")
+        try:
+            self.run_test_scenario(
+                "View and Re-add Compressed Department",
+                [
+                    "2",                    # View Department
+                    "Research",             # Only exists as employees_research.txt.gz
+                    "1",                    # Add New Department
+                    "Research",             # Same name - must be rejected
+                    "3"                     # Exit
+                ],
+                expected_lines=[
+                    "Zoë         Núñez",
+                    "José        Ångström",
+                    "Total employees: 2",
+                    "Error: Department 'Research' already exists!",
+                ],
+                unexpected_lines=["How many employees"]
+            )
+        finally:
+            gz_roster.unlink()
+        
+        # Test 10: Long IDs after the first 1000-row chunk has fixed the column widths
+        long_roster = self.data_dir / "employees_platform.txt"
+        with open(long_roster, 'w', encoding='utf-8') as f:
+            for num in range(1, 1001):
+                f.write(f"Ann,Lee,P{num:04d},Entry\n")
+            f.write("Raj,Iyer,CORP-ENGINEERING-000123,Senior\n")
+            f.write("Mia,Ford,CORP-ENGINEERING-000124,Middle\n")
+        try:
+            self.run_test_scenario(
+                "View Long IDs in a Later Chunk",
+                [
+                    "2",                    # View Department
+                    "Platform",             # Long IDs only appear after row 1000
+                    "3"                     # Exit
+                ],
+                expected_lines=[
+                    "CORP-ENGINEERING-000123",
+                    "CORP-ENGINEERING-000124",
+                    "Total employees: 1002",
+                ],
+                unexpected_lines=["CORP-ENG..."]
+            )
+        finally:
+            long_roster.unlink()
+        
+    def run_sqlite_tests(self):
+        """Execute the menu scenarios against the SQLite backend, plus a migration."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = os.path.join(tmp_dir, "roster.db")
+            sqlite_args = ["--backend", "sqlite", "--db", db_path]
+            
+            self.run_test_scenario(
+                "SQLite: Add Department 'Sales'",
+                ["1", "Sales", "2",
+                 "John", "Doe", "E001", "Senior",
+                 "Jane", "Smith", "E002", "3",
+                 "3"],
+                expected_lines=[
+                    "Success! Created 'Sales' department with 2 employee(s).",
+                    f"Data saved to: {db_path} (department 'Sales')",
+                ],
+                args=sqlite_args
+            )
+            
+            self.run_test_scenario(
+                "SQLite: View Department 'Sales'",
+                ["2", "sales", "3"],
+                expected_lines=[
+                    "1  John        Doe        E001         Senior",
+                    "2  Jane        Smith      E002         Middle",
+                    "Total employees: 2",
+                ],
+                args=sqlite_args
+            )
+            
+            self.run_test_scenario(
+                "SQLite: Add Duplicate Department",
+                ["1", "Sales", "3"],
+                expected_lines=["Error: Department 'Sales' already exists!"],
+                unexpected_lines=["How many employees"],
+                args=sqlite_args
+            )
+            
+            self.run_test_scenario(
+                "SQLite: Missing Department Retry",
+                ["2", "IT", "y", "Sales", "3"],
+                expected_lines=[
+                    "Error: Department 'IT' not found!",
+                    "Employee Roster for 'Sales':",
+                    "Total employees: 2",
+                ],
+                args=sqlite_args
+            )
+            
+            migrated_db = os.path.join(tmp_dir, "migrated.db")
+            self.run_test_scenario(
+                "SQLite: Migrate Sample data/ Rosters",
+                [],
+                expected_lines=[
+                    "Imported: Engineering from employees_engineering.txt",
+                    "Imported: Marketing from employees_marketing.txt",
+                    "Imported: Sales from employees_sales.txt",
+                    "Migration complete!",
+                ],
+                args=["--data-dir", str(self.data_dir), "--db", migrated_db],
+                script='migrate_to_sqlite.py'
+            )
+            
+            self.run_test_scenario(
+                "SQLite: View Migrated Department",
+                ["2", "Engineering", "3"],
+                expected_lines=[
+                    "1  Bob         Wilson     ENG001       Entry",
+                    "2  Carol       Davis      ENG002       Executive",
+                    "Total employees: 2",
+                ],
+                args=["--backend", "sqlite", "--db", migrated_db]
+            )
+        
+    def run_diff_scenario(self, scenario_name, old_rosters, new_rosters, expected_lines,
+                          unexpected_lines=(), extra_args=(), compare_files=None, same_mtime=False):
+        """
+        Run roster_diff.py on two snapshot directories and check its output.
+        Roster contents are written to temporary old/ and new/ folders; names
+        ending in .gz are gzip-compressed. Pass compare_files to diff one file
+        from each side instead of the whole folders.
+        """
+        print(f"\n{'='*60}")
+        print(f"TEST SCENARIO: {scenario_name}")
+        print(f"{'='*60}")
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            snapshots = {}
+            for side, rosters in (("old", old_rosters), ("new", new_rosters)):
+                side_dir = Path(tmp_dir) / side
+                side_dir.mkdir()
+                for filename, content in rosters.items():
+                    path = side_dir / filename
+                    if filename.endswith(".gz"):
+                        with gzip.open(path, 'wt', encoding='utf-8') as f:
+                            f.write(content)
+                    else:
+                        path.write_text(content, encoding='utf-8')
+                snapshots[side] = side_dir
+            
+            if same_mtime:
+                # Make every file look identical by timestamp, like cp -p or rsync would
+                stamp = time.time() - 3600
+                for path in Path(tmp_dir).rglob("employees_*"):
+                    os.utime(path, (stamp, stamp))
+            
+            if compare_files:
+                targets = [str(snapshots["old"] / compare_files[0]), str(snapshots["new"] / compare_files[1])]
+            else:
+                targets = [str(snapshots["old"]), str(snapshots["new"])]
+            
+            try:
+                result = subprocess.run(
+                    [sys.executable, 'roster_diff.py', *targets, *extra_args],
+                    text=True,
+                    capture_output=True,
+                    timeout=30
+                )
+                output, errors = result.stdout, result.stderr
+            except Exception as e:
+                output, errors = "", str(e)
+        
+        print("PROGRAM OUTPUT:")
+        print("-" * 40)
+        print(output)
+        if errors:
+            print("ERRORS:")
+            print(errors)
+        
+        print("OUTPUT VERIFICATION:")
+        print("-" * 40)
+        test_passed = not errors
+        for line in expected_lines:
+            found = line in output
+            test_passed = test_passed and found
+            print(f"{'✓' if found else '✗'} Expected: {line}")
+        for line in unexpected_lines:
+            found = line in output
+            test_passed = test_passed and not found
+            print(f"{'✗' if found else '✓'} Not expected: {line}")
+        
+        self.test_results.append({
+            'scenario': scenario_name,
+            'passed': test_passed,
+            'output': output,
+            'errors': errors
+        })
+        print(f"\nTEST RESULT: {'PASSED' if test_passed else 'FAILED'}")
+        print(f"\n{'='*60}")
+        
+    def run_diff_tests(self):
+        """Execute the roster diff scenarios, unbucketed and bucketed."""
+        sales_before = "John,Doe,E001,Senior\nJane,Smith,E002,Middle\n"
+        sales_after = "John,Doe,E001,Management\nSam,Lee,E003,Entry\n"
+        repeated_before = "Ann,Bell,E001,Entry\nCal,Dunn,E001,Junior\nXia,Yang,E002,Entry\n"
+        repeated_after = "Ann,Bell,E001,Entry\nCal,Dunn,E001,Junior\nXia,Yang,E002,Senior\n"
+        sales_changes = [
+            "~ seniority  E001       John Doe: Senior -> Management",
+            "+ hired      E003       Sam Lee (Entry)",
+            "- departed   E002       Jane Smith (Middle)",
+            "Hires: 1, Departures: 1, Seniority changes: 1, Other edits: 0",
+        ]
+        repeated_changes = [
+            "~ seniority  E002       Xia Yang: Entry -> Senior",
+            "Hires: 0, Departures: 0, Seniority changes: 1, Other edits: 0",
+        ]
+        
+        # Both paths: everything in memory, and spilled to hash buckets on disk
+        for label, extra_args in (("in memory", ()), ("bucketed", ("--max-records", "1"))):
+            self.run_diff_scenario(
+                f"Diff Hires/Departures/Seniority ({label})",
+                {"employees_sales.txt": sales_before},
+                {"employees_sales.txt": sales_after},
+                sales_changes,
+                extra_args=extra_args,
+                compare_files=("employees_sales.txt", "employees_sales.txt")
+            )
+            self.run_diff_scenario(
+                f"Diff Repeated Employee IDs ({label})",
+                {"employees_sales.txt": repeated_before},
+                {"employees_sales.txt": repeated_after},
+                repeated_changes,
+                unexpected_lines=["hired", "departed", "~ seniority  E001"],
+                extra_args=extra_args,
+                compare_files=("employees_sales.txt", "employees_sales.txt")
+            )
+        
+        self.run_diff_scenario(
+            "Diff Same Size and mtime, Different Content",
+            {"employees_sales.txt": "Ann,Bell,E001,Middle\n"},
+            {"employees_sales.txt": "Ann,Bell,E001,Junior\n"},
+            ["sales (changed):", "~ seniority  E001       Ann Bell: Middle -> Junior"],
+            unexpected_lines=["1 unchanged department(s) skipped."],
+            same_mtime=True
+        )
+        
+        self.run_diff_scenario(
+            "Diff Directories Skip Unchanged Departments",
+            {"employees_sales.txt": sales_before, "employees_marketing.txt": "Alice,Johnson,M001,Entry\n"},
+            {"employees_sales.txt.gz": sales_before, "employees_marketing.txt": "Alice,Johnson,M001,Entry\n",
+             "employees_hr.txt": "David,Brown,HR001,Management\n"},
+            ["hr (added):", "+ hired      HR001      David Brown (Management)",
+             "2 unchanged department(s) skipped."],
+            unexpected_lines=["sales (", "marketing ("]
+        )
+        
     def generate_summary_report(self):
         """Generate a summary of test results."""
         print("\n" + "="*60)
@@ -271,13 +546,15 @@ def main():
     print()
     
     # Check if main program exists
-    if not os.path.exists('employee_roster.py'):
-        print("Error: employee_roster.py not found in current directory!")
+    if not os.path.exists('employee_roster.py') or not os.path.exists('roster_diff.py'):
+        print("Error: employee_roster.py or roster_diff.py not found in current directory!")
         return
     
     # Run tests
     tester = EmployeeRosterTester()
     tester.run_all_tests()
+    tester.run_sqlite_tests()
+    tester.run_diff_tests()
     tester.generate_summary_report()
     
     # Create markdown report for README
@@ -0,0 +1,79 @@
+"""
+Compression Benchmark for Employee Roster Manager
+Generates a corpus of department rosters and compares file size versus read speed
+for plain text and each supported compressed format.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from generate_roster_data import generate_dataset
+from roster_storage import COMPRESSED_OPENERS, open_roster
+
+def generate_corpus(directory, num_departments=50, employees_per_dept=2000, seed=42):
+    """
+    Writes plain-text rosters with the synthetic data generator.
+
+    Returns:
+        list: Paths of the generated .txt files
+    """
+    generated = generate_dataset(directory, num_departments, employees_per_dept, "fixed", seed=seed)
+    return [path for _, path, _ in generated]
+
+def convert_corpus(paths, ext):
+    """Copies every roster into a compressed variant with the given extension."""
+    converted = []
+    for path in paths:
+        target = path + ext
+        with open_roster(path) as src, open_roster(target, 'w') as dst:
+            for line in src:
+                dst.write(line)
+        converted.append(target)
+    return converted
+
+def time_reads(paths, repeats=3):
+    """
+    Streams every file line by line, like view_department() does.
+
+    Returns:
+        float: Best wall-clock time in seconds across the repeats
+    """
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for path in paths:
+            with open_roster(path) as f:
+                for _line in f:
+                    pass
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def run_benchmark(num_departments=50, employees_per_dept=2000):
+    """Runs the full size/throughput comparison and prints a table."""
+    with tempfile.TemporaryDirectory() as tmp:
+        plain = generate_corpus(tmp, num_departments, employees_per_dept)
+        formats = [(".txt", plain)]
+        for ext in COMPRESSED_OPENERS:
+            formats.append((ext, convert_corpus(plain, ext)))
+
+        raw_bytes = sum(os.path.getsize(p) for p in plain)
+        print(f"Corpus: {num_departments} departments x {employees_per_dept} employees "
+              f"({raw_bytes / 1e6:.2f} MB uncompressed)")
+        print("=" * 60)
+        print(f"{'Format':<8}{'Size (MB)':>12}{'Ratio':>10}{'Read (s)':>12}{'MB/s':>12}")
+        print("-" * 60)
+        for ext, paths in formats:
+            size = sum(os.path.getsize(p) for p in paths)
+            seconds = time_reads(paths)
+            print(f"{ext:<8}{size / 1e6:>12.2f}{raw_bytes / size:>10.2f}"
+                  f"{seconds:>12.3f}{raw_bytes / 1e6 / seconds:>12.1f}")
+        print("=" * 60)
+        print("MB/s is measured against the uncompressed size, so it's directly comparable.")
+
+if __name__ == "__main__":
+    depts = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    per_dept = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    run_benchmark(depts, per_dept)
@@ -7,6 +7,10 @@ concepts through a practical employee management system.
 """
 
 import os
+import argparse
+
+from roster_storage import build_filename, get_storage, TextFileStorage
+from roster_display import render_roster, pager_output
 
 def get_valid_integer(prompt, min_val=1):
     """
@@ -73,28 +77,17 @@ def get_valid_seniority():
             
             print(f"'{choice}' isn't a valid seniority level. Please try again.")
 
-def build_filename(dept_name):
-    """
-    Builds a safe filename from a department name.
-    Handles spaces and special characters so we don't break the filesystem.
-    
-    Args:
-        dept_name (str): The department name (e.g., "Human Resources")
-    
-    Returns:
-        str: Safe filename (e.g., "data/employees_human_resources.txt")
-    """
-    # Make it lowercase and replace spaces with underscores for safety
-    safe_name = dept_name.lower().replace(" ", "_")
-    # Remove any other potentially problematic characters
-    safe_name = "".join(c for c in safe_name if c.isalnum() or c == "_")
-    return f"data/employees_{safe_name}.txt"
-
-def add_department():
+def add_department(storage=None):
     """
     Creates a new department with employee data.
     Won't overwrite existing departments - gotta keep that data safe!
+    
+    Args:
+        storage: Storage backend to save into (default: plain text files)
     """
+    if storage is None:
+        storage = TextFileStorage()
+    
     print("\n=== Add New Department ===")
     
     # Get department name and check if it already exists
@@ -103,8 +96,7 @@ def add_department():
         print("Department name can't be empty!")
         return
     
-    filename = build_filename(dept_name)
-    if os.path.exists(filename):
+    if storage.department_exists(dept_name):
         print(f"Error: Department '{dept_name}' already exists!")
         print("   Choose a different name or use 'View Department' to see existing data.")
         return
@@ -145,28 +137,32 @@ def add_department():
         
         # Store employee data
         # Format: FirstName,LastName,EmployeeID,SeniorityLevel
-        employee_line = f"{first_name},{last_name},{emp_id},{seniority}"
-        employees.append(employee_line)
+        employees.append((first_name, last_name, emp_id, seniority))
     
-    # Save to file
+    # Save to storage
     try:
-        with open(filename, 'w') as f:
-            for employee in employees:
-                f.write(employee + "\n")
+        location = storage.save_department(dept_name, employees)
         
         print(f"\nSuccess! Created '{dept_name}' department with {num_employees} employee(s).")
-        print(f"Data saved to: {filename}")
+        print(f"Data saved to: {location}")
         
     except PermissionError:
-        print(f"Error: Permission denied! Can't write to {filename}")
+        print(f"Error: Permission denied! Can't write to {build_filename(dept_name)}")
     except Exception as e:
         print(f"Error: Unexpected error saving file: {e}")
 
-def view_department():
+def view_department(storage=None, pager=None):
     """
     Displays the employee roster for an existing department.
     Handles missing files gracfully and offers retry options.
+    
+    Args:
+        storage: Storage backend to read from (default: plain text files)
+        pager (str): Pager command to page the roster through (default: print it)
     """
+    if storage is None:
+        storage = TextFileStorage()
+    
     print("\n=== View Department Roster ===")
     
     while True:  # Allow retries if department not found
@@ -175,26 +171,15 @@ def view_department():
             print("Please enter a department name!")
             continue
         
-        filename = build_filename(dept_name)
-        
         try:
-            with open(filename, 'r') as f:
-                lines = f.readlines()
-            
-            # Display the roster with nice formatting
-            print(f"\nEmployee Roster for '{dept_name.title()}':")
-            print("=" * 60)
-            
-            if not lines:
-                print("   (No employees found in this department)")
-            else:
-                for i, line in enumerate(lines, 1):
-                    employee_info = line.strip()
-                    if employee_info:  # Skip empty lines
-                        print(f"   {i:2d}. {employee_info}")
-            
-            print("=" * 60)
-            print(f"   Total employees: {len([l for l in lines if l.strip()])}")
+            # Stream records one at a time - works the same for every backend
+            with storage.read_department(dept_name) as records:
+                # Buffered chunks, aligned columns - narrowed for a terminal, full width in a pager
+                if pager:
+                    with pager_output(pager) as out:
+                        render_roster(dept_name, records, out)
+                else:
+                    render_roster(dept_name, records)
             break  # Successfully displayed, exit the retry loop
             
         except FileNotFoundError:
@@ -203,21 +188,43 @@ def view_department():
             if retry not in ['y', 'yes']:
                 print("   Returning to main menu...")
                 break
+        except BrokenPipeError:
+            break  # Pager closed (or output piped to something like head) - that's fine
         except PermissionError:
-            print(f"Error: Permission denied reading {filename}")
+            print(f"Error: Permission denied reading {build_filename(dept_name)}")
             break
         except Exception as e:
             print(f"Error: Unexpected error reading file: {e}")
             break
 
-def main():
+def main(backend="text", db_path="data/roster.db", pager=None):
     """
     Main program loop with menu system.
     Keeps running until the user decides to quit - nice and simple!
+    
+    Args:
+        backend (str): "text" for flat files or "sqlite" for the database
+        db_path (str): Database path when using the sqlite backend
+        pager (str): Pager command for viewing rosters (default: no pager)
     """
     # Make sure our data directory exists before we start
     os.makedirs("data", exist_ok=True)
     
+    # One storage object for the whole session (sqlite keeps its connection open)
+    storage = get_storage(backend, db_path)
+    try:
+        run_menu(storage, pager)
+    finally:
+        storage.close()
+
+def run_menu(storage, pager=None):
+    """
+    Shows the menu until the user exits.
+    
+    Args:
+        storage: Storage backend shared by every menu action
+        pager (str): Pager command for viewing rosters (default: no pager)
+    """
     print("Welcome to the Employee Roster Manager!")
     print("Your one-stop shop for department employee tracking")
     
@@ -235,9 +242,9 @@ def main():
             choice = input("Choose an option (1-3): ").strip()
             
             if choice == '1':
-                add_department()
+                add_department(storage)
             elif choice == '2':
-                view_department()
+                view_department(storage, pager)
             elif choice == '3':
                 print("\nThanks for using Employee Roster Manager!")
                 print("Have a great day!")
@@ -253,4 +260,12 @@ def main():
             print("The program will continue, but you might want to restart.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Employee Roster Manager")
+    parser.add_argument("--backend", choices=["text", "sqlite"], default="text",
+                        help="where department data is stored (default: text)")
+    parser.add_argument("--db", default="data/roster.db",
+                        help="SQLite database path (default: data/roster.db)")
+    parser.add_argument("--pager", nargs="?", const=os.environ.get("PAGER") or "less",
+                        help="page rosters through a pager (default: $PAGER or less)")
+    args = parser.parse_args()
+    main(args.backend, args.db, args.pager)
\ No newline at end of file
@@ -0,0 +1,224 @@
+"""
+Synthetic Data Generator for Employee Roster Manager
+Produces realistic department rosters at scale in the same CSV format the
+main program writes, so everything else (viewing, migration, diffs, load
+tests) can be exercised on more than three tiny sample files.
+"""
+
+import argparse
+import math
+import os
+import random
+
+from roster_storage import COMPRESSED_OPENERS, department_key, format_employee_line, open_roster
+
+SENIORITY_LEVELS = ["Entry", "Junior", "Middle", "Senior", "Management", "Executive"]
+# Rough pyramid - lots of individual contributors, few executives
+DEFAULT_SENIORITY_MIX = {
+    "Entry": 25, "Junior": 25, "Middle": 25, "Senior": 15, "Management": 8, "Executive": 2,
+}
+
+FIRST_NAMES = [
+    "John", "Jane", "Alice", "Bob", "Carol", "David", "Emma", "Frank", "Grace", "Henry",
+    "Isla", "Jack", "Karen", "Liam", "Maria", "Noah", "Olivia", "Priya", "Quinn", "Rosa",
+    "Sam", "Tara", "Umar", "Vera", "Wei", "Ximena", "Yusuf", "Zoe", "Ahmed", "Mei",
+]
+LAST_NAMES = [
+    "Doe", "Smith", "Johnson", "Wilson", "Davis", "Brown", "Miller", "Taylor", "Clark", "Lewis",
+    "Garcia", "Nguyen", "Patel", "Kim", "Martin", "Lopez", "Singh", "Chen", "Okafor", "Rossi",
+    "Muller", "Silva", "Khan", "Ivanova", "Cohen", "Tanaka", "Dubois", "Novak", "Murphy", "Haddad",
+]
+DEPARTMENT_NAMES = [
+    "Sales", "Marketing", "Engineering", "Finance", "Support", "Operations",
+    "Legal", "Research", "Design", "Logistics", "Human Resources", "Procurement",
+]
+REGIONS = ["North", "South", "East", "West", "Central"]
+
+SIZE_DISTRIBUTIONS = ["fixed", "uniform", "lognormal"]
+# Kept apart from data/ so generated rosters never replace the real ones
+DEFAULT_OUT_DIR = os.path.join("data", "generated")
+
+def parse_seniority_mix(text):
+    """
+    Parses a seniority mix like "Entry=40,Senior=10" into weights.
+    Levels that aren't mentioned get a weight of 0. Raises ValueError for an
+    unknown level, a missing, non-numeric or negative weight, or an all-zero mix.
+
+    Args:
+        text (str): Comma-separated Level=weight pairs (case-insensitive)
+
+    Returns:
+        dict: Seniority level -> weight
+    """
+    mix = {level: 0 for level in SENIORITY_LEVELS}
+    for part in text.split(","):
+        name, sep, weight = part.partition("=")
+        name = name.strip()
+        if not sep:
+            raise ValueError(f"'{part.strip()}' needs a weight, like {name or 'Entry'}=10")
+        matches = [level for level in SENIORITY_LEVELS if level.lower() == name.lower()]
+        if not matches:
+            raise ValueError(f"'{name}' isn't a valid seniority level")
+        try:
+            value = float(weight)
+        except ValueError:
+            value = math.nan
+        if not math.isfinite(value):
+            raise ValueError(f"Weight for {matches[0]} must be a number, not '{weight.strip()}'")
+        if value < 0:
+            raise ValueError(f"Weight for {matches[0]} can't be negative")
+        mix[matches[0]] = value
+    if sum(mix.values()) <= 0:
+        raise ValueError("Seniority mix needs at least one positive weight")
+    return mix
+
+def department_names(count):
+    """
+    Makes unique, realistic-looking department names.
+
+    Returns:
+        list: count names like "Sales", "Sales North", "Sales North 2", ...
+    """
+    names = []
+    round_num = 0
+    while len(names) < count:
+        for region in [None] + REGIONS:
+            for base in DEPARTMENT_NAMES:
+                name = base if region is None else f"{base} {region}"
+                if round_num:
+                    name = f"{name} {round_num + 1}"
+                names.append(name)
+                if len(names) == count:
+                    return names
+        round_num += 1
+    return names
+
+def department_size(rng, distribution, mean_size):
+    """
+    Draws a department headcount (always at least 1).
+
+    Args:
+        rng (random.Random): Random source
+        distribution (str): "fixed", "uniform" or "lognormal"
+        mean_size (int): Average headcount
+
+    Returns:
+        int: Number of employees
+    """
+    if distribution == "fixed":
+        return max(1, mean_size)
+    if distribution == "uniform":
+        return rng.randint(1, max(1, 2 * mean_size - 1))
+    # Lognormal: most departments are small, a few are huge - like real orgs
+    sigma = 1.0
+    mu = math.log(max(1, mean_size)) - sigma ** 2 / 2
+    return max(1, int(rng.lognormvariate(mu, sigma)))
+
+def generate_department(rng, dept_name, size, seniority_mix, duplicate_rate=0.0, dept_index=0):
+    """
+    Yields employee records for one department.
+    IDs look like "SN004-000017": department initials, then the department
+    index (which keeps Sales and Support apart), then the employee number.
+
+    Args:
+        rng (random.Random): Random source
+        dept_name (str): Used to build the employee ID prefix
+        size (int): Number of records
+        seniority_mix (dict): Seniority level -> weight
+        duplicate_rate (float): Chance (0-1) that a record reuses an earlier ID
+        dept_index (int): Unique number for this department within the dataset
+
+    Yields:
+        tuple: (FirstName, LastName, EmployeeID, SeniorityLevel)
+    """
+    prefix = "".join(word[0] for word in dept_name.split() if word[0].isalpha()).upper() or "E"
+    levels = list(seniority_mix)
+    weights = [seniority_mix[level] for level in levels]
+    issued = 0
+    for _ in range(size):
+        if issued and rng.random() < duplicate_rate:
+            emp_num = rng.randint(1, issued)
+        else:
+            issued += 1
+            emp_num = issued
+        yield (
+            rng.choice(FIRST_NAMES),
+            rng.choice(LAST_NAMES),
+            f"{prefix}{dept_index:03d}-{emp_num:06d}",
+            rng.choices(levels, weights)[0],
+        )
+
+def generate_dataset(out_dir=DEFAULT_OUT_DIR, num_departments=10, mean_size=100, distribution="lognormal",
+                     seniority_mix=None, duplicate_rate=0.0, compress="", seed=None, overwrite=False):
+    """
+    Writes a full set of department roster files.
+
+    Args:
+        out_dir (str): Directory to write employees_*.txt files into
+        num_departments (int): How many departments to create
+        mean_size (int): Average employees per department
+        distribution (str): Department size distribution (see SIZE_DISTRIBUTIONS)
+        seniority_mix (dict): Seniority level -> weight (default: DEFAULT_SENIORITY_MIX)
+        duplicate_rate (float): Chance that a record reuses an existing employee ID
+                                within its department (IDs never repeat across departments)
+        compress (str): Compression extension like ".gz", or "" for plain text
+        seed (int): Random seed for repeatable datasets
+        overwrite (bool): Replace roster files that already exist (default: refuse)
+
+    Returns:
+        list: (department_name, path, employee_count) tuples
+    """
+    rng = random.Random(seed)
+    seniority_mix = seniority_mix or DEFAULT_SENIORITY_MIX
+    os.makedirs(out_dir, exist_ok=True)
+
+    names = department_names(num_departments)
+    paths = [os.path.join(out_dir, f"employees_{department_key(name)}.txt{compress}") for name in names]
+    # Check everything up front so a clash never leaves a half-written dataset
+    existing = [path for path in paths if os.path.exists(path)]
+    if existing and not overwrite:
+        raise FileExistsError(f"{len(existing)} roster file(s) already exist in {out_dir}, "
+                              f"e.g. {existing[0]}")
+
+    written = []
+    for dept_index, (dept_name, path) in enumerate(zip(names, paths), 1):
+        size = department_size(rng, distribution, mean_size)
+        with open_roster(path, 'w') as f:
+            for record in generate_department(rng, dept_name, size, seniority_mix, duplicate_rate,
+                                              dept_index):
+                f.write(format_employee_line(record) + "\n")
+        written.append((dept_name, path, size))
+    return written
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate synthetic department rosters")
+    parser.add_argument("--out-dir", default=DEFAULT_OUT_DIR,
+                        help=f"where to write roster files (default: {DEFAULT_OUT_DIR})")
+    parser.add_argument("--departments", type=int, default=10, help="number of departments")
+    parser.add_argument("--mean-size", type=int, default=100, help="average employees per department")
+    parser.add_argument("--distribution", choices=SIZE_DISTRIBUTIONS, default="lognormal",
+                        help="department size distribution (default: lognormal)")
+    parser.add_argument("--seniority-mix", default=None,
+                        help='weights like "Entry=40,Junior=30,Senior=20,Executive=10"')
+    parser.add_argument("--duplicate-rate", type=float, default=0.0,
+                        help="chance (0-1) that a row reuses an existing employee ID")
+    parser.add_argument("--compress", choices=[""] + list(COMPRESSED_OPENERS), default="",
+                        help="write compressed rosters with this extension")
+    parser.add_argument("--seed", type=int, default=None, help="random seed for repeatable output")
+    parser.add_argument("--force", action="store_true", help="overwrite roster files that already exist")
+    args = parser.parse_args()
+    if not 0 <= args.duplicate_rate <= 1:
+        parser.error("--duplicate-rate must be between 0 and 1")
+
+    try:
+        mix = parse_seniority_mix(args.seniority_mix) if args.seniority_mix else None
+        results = generate_dataset(args.out_dir, args.departments, args.mean_size, args.distribution,
+                                   mix, args.duplicate_rate, args.compress, args.seed, args.force)
+    except FileExistsError as e:
+        print(f"Error: {e}")
+        print("   Choose a different --out-dir, or pass --force to overwrite them.")
+    except ValueError as e:
+        print(f"Error: {e}")
+    else:
+        total = sum(count for _, _, count in results)
+        print(f"Generated {len(results)} department(s) with {total} employee(s) in {args.out_dir}/")
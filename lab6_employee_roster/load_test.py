@@ -0,0 +1,220 @@
+"""
+Load Test Driver for Employee Roster Manager
+Seeds a scratch directory with generated departments, then runs concurrent
+mixed add/view workloads through the same storage and rendering code the menu
+uses, and reports latency percentiles and throughput per operation.
+"""
+
+import argparse
+import glob
+import os
+import random
+import tempfile
+import threading
+import time
+
+from generate_roster_data import (DEFAULT_SENIORITY_MIX, SIZE_DISTRIBUTIONS, generate_dataset,
+                                  generate_department)
+from roster_display import render_roster
+from roster_storage import SQLiteStorage, TextFileStorage, get_storage
+
+class NullOutput:
+    """Text sink for rendered rosters - we're timing the work, not the terminal."""
+
+    def write(self, text):
+        return len(text)
+
+    def flush(self):
+        pass
+
+def percentile(sorted_values, pct):
+    """
+    Nearest-rank percentile of an already sorted list.
+
+    Args:
+        sorted_values (list): Values in ascending order
+        pct (float): Percentile between 0 and 100
+
+    Returns:
+        float: The percentile value (0.0 for an empty list)
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+class LoadTester:
+    """Seeds departments, runs the mixed workload and collects latencies."""
+
+    def __init__(self, backend="text", db_path="data/roster.db", add_ratio=0.2,
+                 employees_per_add=50, seed=None):
+        self.backend = backend
+        self.db_path = db_path
+        self.add_ratio = add_ratio
+        self.employees_per_add = employees_per_add
+        self.seed = seed
+        self.departments = []
+        self.num_seeded = 0
+        self.lock = threading.Lock()
+        self.latencies = {"add": [], "view": []}
+        self.errors = 0
+
+    def seed_data(self, num_departments, mean_size, distribution):
+        """
+        Generates the starting departments (and loads them into SQLite if needed).
+        Refuses to run if the work directory already has roster files or a database.
+        """
+        if self.backend == "sqlite" and os.path.exists(self.db_path):
+            raise FileExistsError(f"{self.db_path} already exists")
+        # Any roster already here would be mixed into the run, so don't even start
+        existing = sorted(glob.glob(os.path.join("data", "employees_*")))
+        if existing:
+            raise FileExistsError(f"{len(existing)} roster file(s) already exist in data, e.g. {existing[0]}")
+        generated = generate_dataset("data", num_departments, mean_size, distribution, seed=self.seed)
+        if self.backend == "sqlite":
+            text_storage = TextFileStorage()
+            storage = SQLiteStorage(self.db_path)
+            try:
+                for dept_name, _, _ in generated:
+                    with text_storage.read_department(dept_name) as records:
+                        storage.save_department(dept_name, records)
+            finally:
+                storage.close()
+        self.departments = [dept_name for dept_name, _, _ in generated]
+        self.num_seeded = len(generated)
+
+    def add_operation(self, storage, op_num, rng):
+        """Same steps as add_department(): check for a duplicate, then save."""
+        dept_name = f"Load Test {op_num}"
+        if storage.department_exists(dept_name):
+            return
+        # Index past the seeded departments so added IDs never clash with them
+        dept_index = self.num_seeded + op_num + 1
+        records = list(generate_department(rng, dept_name, self.employees_per_add, DEFAULT_SENIORITY_MIX,
+                                           dept_index=dept_index))
+        storage.save_department(dept_name, records)
+        with self.lock:
+            self.departments.append(dept_name)
+
+    def view_operation(self, storage, rng):
+        """Same steps as view_department(): stream the records and render them."""
+        with self.lock:
+            dept_name = rng.choice(self.departments)
+        with storage.read_department(dept_name) as records:
+            render_roster(dept_name, records, NullOutput(), max_width=120)
+
+    def run_operation(self, storage, op_num):
+        """Runs one randomly chosen add or view and records how long it took."""
+        rng = random.Random(None if self.seed is None else self.seed + op_num)
+        kind = "add" if rng.random() < self.add_ratio else "view"
+        start = time.perf_counter()
+        try:
+            if kind == "add":
+                self.add_operation(storage, op_num, rng)
+            else:
+                self.view_operation(storage, rng)
+        except Exception as e:
+            with self.lock:
+                self.errors += 1
+            print(f"   Operation {op_num} ({kind}) failed: {e}")
+            return
+        elapsed = time.perf_counter() - start
+        with self.lock:
+            self.latencies[kind].append(elapsed)
+
+    def worker(self, op_numbers):
+        """
+        Runs operations until the shared counter runs out.
+        Each worker opens its own storage - SQLite connections can't be shared
+        across threads - and keeps it for every operation it runs.
+        """
+        storage = get_storage(self.backend, self.db_path)
+        try:
+            while True:
+                with self.lock:
+                    op_num = next(op_numbers, None)
+                if op_num is None:
+                    break
+                self.run_operation(storage, op_num)
+        finally:
+            storage.close()
+
+    def run(self, operations, workers):
+        """
+        Runs the workload across worker threads.
+
+        Returns:
+            float: Total wall-clock time in seconds
+        """
+        op_numbers = iter(range(operations))
+        threads = [threading.Thread(target=self.worker, args=(op_numbers,)) for _ in range(workers)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return time.perf_counter() - start
+
+    def report(self, wall_time, workers):
+        """Prints latency percentiles and throughput for each operation type."""
+        print("=" * 72)
+        print(f"LOAD TEST RESULTS ({self.backend} backend, {workers} worker(s))")
+        print("=" * 72)
+        print(f"{'Operation':<10}{'Count':>8}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}"
+              f"{'max ms':>10}{'ops/s':>12}")
+        print("-" * 72)
+        total = 0
+        for kind, values in self.latencies.items():
+            values = sorted(values)
+            total += len(values)
+            ms = [percentile(values, p) * 1000 for p in (50, 90, 99, 100)]
+            print(f"{kind:<10}{len(values):>8}{ms[0]:>10.2f}{ms[1]:>10.2f}{ms[2]:>10.2f}"
+                  f"{ms[3]:>10.2f}{len(values) / wall_time:>12.1f}")
+        print("-" * 72)
+        print(f"Total: {total} operation(s) in {wall_time:.2f}s "
+              f"({total / wall_time:.1f} ops/s), {self.errors} error(s)")
+
+def main():
+    """Command-line entry point: seed, run and report."""
+    parser = argparse.ArgumentParser(description="Concurrent add/view load test")
+    parser.add_argument("--backend", choices=["text", "sqlite"], default="text")
+    parser.add_argument("--operations", type=int, default=1000, help="total operations to run")
+    parser.add_argument("--workers", type=int, default=8, help="concurrent worker threads")
+    parser.add_argument("--add-ratio", type=float, default=0.2, help="fraction of operations that add (0-1)")
+    parser.add_argument("--employees-per-add", type=int, default=50, help="employees per added department")
+    parser.add_argument("--departments", type=int, default=50, help="departments to seed before the run")
+    parser.add_argument("--mean-size", type=int, default=500, help="average seeded department size")
+    parser.add_argument("--distribution", choices=SIZE_DISTRIBUTIONS, default="lognormal",
+                        help="seeded department size distribution")
+    parser.add_argument("--seed", type=int, default=None, help="random seed for repeatable runs")
+    parser.add_argument("--work-dir", default=None,
+                        help="empty directory to run in (default: a temporary directory, deleted afterwards)")
+    args = parser.parse_args()
+    if not 0 <= args.add_ratio <= 1:
+        parser.error("--add-ratio must be between 0 and 1")
+    if args.departments < 1:
+        parser.error("--departments must be at least 1 (views need something to read)")
+
+    original_dir = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Run in a scratch directory so the real data/ folder is never touched
+        os.chdir(args.work_dir or tmp_dir)
+        try:
+            os.makedirs("data", exist_ok=True)
+            tester = LoadTester(args.backend, add_ratio=args.add_ratio,
+                                employees_per_add=args.employees_per_add, seed=args.seed)
+            print(f"Seeding {args.departments} department(s)...")
+            try:
+                tester.seed_data(args.departments, args.mean_size, args.distribution)
+            except FileExistsError as e:
+                print(f"Error: {e}")
+                print("   Point --work-dir at an empty directory (or leave it out to use a temporary one).")
+                return
+            print(f"Running {args.operations} operation(s) on {args.workers} worker(s)...")
+            wall_time = tester.run(args.operations, args.workers)
+            tester.report(wall_time, args.workers)
+        finally:
+            os.chdir(original_dir)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Migration Tool for Employee Roster Manager
+Imports the existing data/employees_*.txt rosters (compressed ones too) into
+the SQLite backend so the program can be run with --backend sqlite.
+"""
+
+import argparse
+import os
+
+from roster_storage import SQLiteStorage, list_roster_files, open_roster, parse_employee_line
+
+def read_records(path):
+    """
+    Streams records from a roster file, skipping malformed lines.
+
+    Yields:
+        tuple: (FirstName, LastName, EmployeeID, SeniorityLevel)
+    """
+    with open_roster(str(path)) as f:
+        for line_num, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            record = parse_employee_line(line)
+            if len(record) != 4:
+                print(f"   Skipping {path.name} line {line_num}: expected 4 fields, got {len(record)}")
+                continue
+            yield record
+
+def migrate(data_dir="data", db_path="data/roster.db"):
+    """
+    Copies every text roster into the database.
+    Departments already in the database are left alone so re-running is safe.
+
+    Returns:
+        int: Number of departments imported
+    """
+    storage = SQLiteStorage(db_path)
+    imported = 0
+    try:
+        for dept_key, path in list_roster_files(data_dir):
+            dept_name = dept_key.replace("_", " ").title()
+            if storage.department_exists(dept_name):
+                print(f"Skipped:  {dept_name} (already in {db_path})")
+                continue
+            storage.save_department(dept_name, read_records(path))
+            imported += 1
+            print(f"Imported: {dept_name} from {path.name}")
+
+        print("=" * 50)
+        for dept_name, count in storage.count_by_department():
+            print(f"   {dept_name:<30} {count:>6} employee(s)")
+    finally:
+        storage.close()
+    return imported
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import text rosters into SQLite")
+    parser.add_argument("--data-dir", default="data", help="directory with employees_*.txt files")
+    parser.add_argument("--db", default="data/roster.db", help="SQLite database to create or update")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.data_dir):
+        print(f"Error: data directory '{args.data_dir}' not found!")
+    else:
+        total = migrate(args.data_dir, args.db)
+        print(f"\nMigration complete! {total} department(s) imported into {args.db}")
@@ -0,0 +1,336 @@
+"""
+Roster Diff for Employee Roster Manager
+Compares two snapshots of a department roster (or of a whole data/ directory)
+and reports hires, departures, seniority changes and other edits by employee ID.
+
+Each input file is read exactly once. Once a roster has more records than
+fit comfortably in memory, both sides are split into hash buckets on disk by
+employee ID, so only one bucket is ever held in memory.
+Whole directories skip departments that are clearly unchanged, using file
+size and then a content hash before doing any record-level diff. A manifest
+of (size, mtime, hash) from an earlier run lets unchanged files skip hashing.
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import tempfile
+
+from roster_storage import list_roster_files, open_roster, parse_employee_line, format_employee_line
+
+MAX_RECORDS_IN_MEMORY = 200_000  # Old-side records held at once before spilling to buckets
+BUCKET_FANOUT = 64
+MAX_PARTITION_DEPTH = 3  # 64 ** 3 buckets is plenty; past that it's one giant repeated ID
+HASH_BLOCK_SIZE = 1024 * 1024
+
+HIRED = "hired"
+DEPARTED = "departed"
+SENIORITY_CHANGED = "seniority"
+UPDATED = "updated"
+
+def bucket_for(emp_id, num_buckets, level=0):
+    """
+    Picks a bucket for an employee ID. Uses a real hash (not hash()) so both
+    files always agree on the bucket, no matter the process. Each partition
+    level hashes differently so an oversized bucket can be split again.
+
+    Returns:
+        int: Bucket number in range(num_buckets)
+    """
+    digest = hashlib.blake2b(emp_id.encode("utf-8"), digest_size=8,
+                             salt=level.to_bytes(16, "big")).digest()
+    return int.from_bytes(digest, "big") % num_buckets
+
+def iter_records(path):
+    """
+    Streams well-formed records from a roster file (plain or compressed).
+    Blank and malformed lines are skipped since they have no employee ID.
+
+    Yields:
+        tuple: (FirstName, LastName, EmployeeID, SeniorityLevel)
+    """
+    with open_roster(str(path)) as f:
+        for line in f:
+            if line.strip():
+                record = parse_employee_line(line)
+                if len(record) == 4:
+                    yield record
+
+def partition(records, num_buckets, tmp_dir, prefix, level=0):
+    """
+    Splits a record stream into bucket files by hashed employee ID.
+
+    Returns:
+        list: Paths of the bucket files, one per bucket
+    """
+    bucket_paths = [os.path.join(tmp_dir, f"{prefix}_{b}.txt") for b in range(num_buckets)]
+    bucket_files = [open(p, 'w', encoding='utf-8') for p in bucket_paths]
+    try:
+        for record in records:
+            bucket_files[bucket_for(record[2], num_buckets, level)].write(format_employee_line(record) + "\n")
+    finally:
+        for f in bucket_files:
+            f.close()
+    return bucket_paths
+
+def diff_records(old_records, new_records):
+    """
+    Diffs two record streams. Only the old side is held in memory.
+    Repeated employee IDs are matched in order on both sides: the second
+    E001 in the new file is compared with the second E001 in the old file,
+    and any extra copies show up as hires or departures.
+
+    Yields:
+        tuple: (change_type, old_record, new_record) - one side is None
+               for hires and departures
+    """
+    old_by_key = {}
+    old_counts = {}
+    for record in old_records:
+        occurrence = old_counts.get(record[2], 0)
+        old_by_key[(record[2], occurrence)] = record
+        old_counts[record[2]] = occurrence + 1
+
+    # Only IDs that exist on the old side need counting, so this stays small
+    new_counts = {}
+    for new in new_records:
+        emp_id = new[2]
+        if emp_id not in old_counts:
+            yield (HIRED, None, new)
+            continue
+        occurrence = new_counts.get(emp_id, 0)
+        new_counts[emp_id] = occurrence + 1
+        old = old_by_key.pop((emp_id, occurrence), None)
+        if old is None:
+            yield (HIRED, None, new)
+        elif old[3] != new[3]:
+            yield (SENIORITY_CHANGED, old, new)
+        elif old != new:
+            yield (UPDATED, old, new)
+    for old in old_by_key.values():
+        yield (DEPARTED, old, None)
+
+def diff_streams(old_records, new_records, max_records=MAX_RECORDS_IN_MEMORY, level=0):
+    """
+    Diffs two record streams while holding at most max_records old records.
+    If the old side turns out bigger than that, both streams are spilled into
+    hash buckets on disk and each bucket pair is diffed the same way.
+
+    Yields:
+        tuple: (change_type, old_record, new_record)
+    """
+    old_records = iter(old_records)
+    head = list(itertools.islice(old_records, max_records + 1))
+    if len(head) <= max_records or level >= MAX_PARTITION_DEPTH:
+        yield from diff_records(itertools.chain(head, old_records), new_records)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        old_buckets = partition(itertools.chain(head, old_records), BUCKET_FANOUT, tmp_dir, "old", level)
+        del head
+        new_buckets = partition(new_records, BUCKET_FANOUT, tmp_dir, "new", level)
+        for old_bucket, new_bucket in zip(old_buckets, new_buckets):
+            yield from diff_streams(iter_records(old_bucket), iter_records(new_bucket),
+                                    max_records, level + 1)
+
+def diff_rosters(old_path, new_path, max_records=MAX_RECORDS_IN_MEMORY):
+    """
+    Diffs two versions of a roster file by employee ID.
+    Memory is bounded by record count rather than file size, so compressed
+    rosters are bucketed just as reliably as plain ones.
+
+    Args:
+        old_path (str): Earlier snapshot of the roster
+        new_path (str): Later snapshot of the roster
+        max_records (int): Most old-side records to hold in memory at once
+
+    Yields:
+        tuple: (change_type, old_record, new_record)
+    """
+    yield from diff_streams(iter_records(old_path), iter_records(new_path), max_records)
+
+def file_digest(path):
+    """
+    Hashes a file's raw bytes in blocks.
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            sha.update(block)
+    return sha.hexdigest()
+
+def load_manifest(path):
+    """
+    Loads the digest manifest saved by an earlier run.
+
+    Returns:
+        dict: Absolute file path -> {"size", "mtime_ns", "sha256"} (empty if missing)
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def save_manifest(path, manifest):
+    """Writes the digest manifest so the next run can skip re-hashing."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+
+def cached_digest(path, manifest):
+    """
+    Hashes a file, reusing the manifest entry if the file's size and mtime
+    haven't moved since it was last hashed.
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    key = os.path.abspath(path)
+    stat = os.stat(path)
+    entry = manifest.get(key)
+    if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+        return entry["sha256"]
+    digest = file_digest(path)
+    manifest[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest}
+    return digest
+
+def files_unchanged(old_path, new_path, manifest=None):
+    """
+    Fast check for an untouched roster: different sizes mean changed,
+    otherwise the content hashes decide. Two live files can share a size and
+    mtime (cp -p, rsync, tar) and still differ, so mtime is only used to
+    reuse a hash from the manifest of an earlier run.
+
+    Args:
+        old_path (str): Earlier snapshot of the roster
+        new_path (str): Later snapshot of the roster
+        manifest (dict): Digest manifest from load_manifest(), updated in place
+
+    Returns:
+        bool: True if the files are known to be identical
+    """
+    if os.path.getsize(old_path) != os.path.getsize(new_path):
+        return False
+    if manifest is None:
+        return file_digest(old_path) == file_digest(new_path)
+    return cached_digest(old_path, manifest) == cached_digest(new_path, manifest)
+
+def diff_directories(old_dir, new_dir, max_records=MAX_RECORDS_IN_MEMORY, manifest=None):
+    """
+    Diffs every department across two data/ snapshots.
+    Departments that pass files_unchanged() are skipped without reading records.
+
+    Args:
+        old_dir (str): Earlier snapshot directory
+        new_dir (str): Later snapshot directory
+        max_records (int): Passed through to diff_rosters()
+        manifest (dict): Optional digest manifest from load_manifest()
+
+    Yields:
+        tuple: (department_key, status, changes) where status is "added",
+               "removed", "unchanged" or "changed", and changes is an iterator
+               of (change_type, old_record, new_record) tuples. Changes are
+               produced lazily, so finish with one department before moving on.
+    """
+    old_files = dict(list_roster_files(old_dir))
+    new_files = dict(list_roster_files(new_dir))
+    for dept_key in sorted(old_files.keys() | new_files.keys()):
+        old_path = old_files.get(dept_key)
+        new_path = new_files.get(dept_key)
+        if old_path is None:
+            yield (dept_key, "added", ((HIRED, None, r) for r in iter_records(new_path)))
+        elif new_path is None:
+            yield (dept_key, "removed", ((DEPARTED, r, None) for r in iter_records(old_path)))
+        elif files_unchanged(old_path, new_path, manifest):
+            yield (dept_key, "unchanged", iter(()))
+        else:
+            # Peek at the first change - files can differ byte-wise (say, one is
+            # compressed) and still hold the same records
+            changes = diff_rosters(old_path, new_path, max_records)
+            first = next(changes, None)
+            if first is None:
+                yield (dept_key, "unchanged", iter(()))
+            else:
+                yield (dept_key, "changed", itertools.chain([first], changes))
+
+def describe_change(change):
+    """
+    Formats one change for display.
+
+    Returns:
+        str: e.g. "+ hired      E003  Sam Lee (Entry)"
+    """
+    change_type, old, new = change
+    if change_type == HIRED:
+        return f"+ hired      {new[2]:<10} {new[0]} {new[1]} ({new[3]})"
+    if change_type == DEPARTED:
+        return f"- departed   {old[2]:<10} {old[0]} {old[1]} ({old[3]})"
+    if change_type == SENIORITY_CHANGED:
+        return f"~ seniority  {new[2]:<10} {new[0]} {new[1]}: {old[3]} -> {new[3]}"
+    return f"~ updated    {new[2]:<10} {format_employee_line(old)} -> {format_employee_line(new)}"
+
+def print_changes(changes):
+    """
+    Prints changes as they arrive and returns a tally per change type.
+
+    Returns:
+        dict: change_type -> count
+    """
+    counts = {HIRED: 0, DEPARTED: 0, SENIORITY_CHANGED: 0, UPDATED: 0}
+    for change in changes:
+        print(f"   {describe_change(change)}")
+        counts[change[0]] += 1
+    return counts
+
+def print_summary(counts):
+    """Prints the one-line tally from print_changes()."""
+    print(f"   Hires: {counts[HIRED]}, Departures: {counts[DEPARTED]}, "
+          f"Seniority changes: {counts[SENIORITY_CHANGED]}, Other edits: {counts[UPDATED]}")
+
+def main():
+    """Command-line entry point: diff two roster files or two data/ directories."""
+    parser = argparse.ArgumentParser(description="Compare two roster snapshots")
+    parser.add_argument("old", help="earlier roster file or data directory")
+    parser.add_argument("new", help="later roster file or data directory")
+    parser.add_argument("--max-records", type=int, default=MAX_RECORDS_IN_MEMORY,
+                        help="old-side records held in memory before spilling to disk buckets")
+    parser.add_argument("--manifest", default=None,
+                        help="JSON file of (size, mtime, hash) reused between runs to skip re-hashing")
+    args = parser.parse_args()
+
+    for path in (args.old, args.new):
+        if not os.path.exists(path):
+            print(f"Error: '{path}' not found!")
+            return
+
+    manifest = load_manifest(args.manifest) if args.manifest else None
+
+    if os.path.isdir(args.old) and os.path.isdir(args.new):
+        skipped = 0
+        for dept_key, status, changes in diff_directories(args.old, args.new, args.max_records, manifest):
+            if status == "unchanged":
+                skipped += 1
+                continue
+            print(f"\n{dept_key} ({status}):")
+            print_summary(print_changes(changes))
+        print(f"\n{skipped} unchanged department(s) skipped.")
+    elif os.path.isfile(args.old) and os.path.isfile(args.new):
+        if files_unchanged(args.old, args.new, manifest):
+            print("No changes - files are identical.")
+        else:
+            print(f"Changes from {args.old} to {args.new}:")
+            print_summary(print_changes(diff_rosters(args.old, args.new, args.max_records)))
+    else:
+        print("Error: compare two files or two directories, not one of each.")
+        return
+
+    if args.manifest:
+        save_manifest(args.manifest, manifest)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+Roster rendering for the Employee Roster Manager.
+
+Rows are formatted into an in-memory buffer a chunk at a time and written out
+in large blocks, instead of one print() per employee. Output can also be piped
+into a pager; since chunks are flushed as they're ready, the pager can start
+showing the roster before the whole department has been read.
+"""
+
+import io
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+from contextlib import contextmanager
+
+from roster_storage import format_employee_line
+
+DEFAULT_CHUNK_SIZE = 1000
+
+COLUMN_HEADERS = ("First Name", "Last Name", "Employee ID", "Seniority")
+SENIORITY_WIDTH = len("Management")  # Longest seniority level
+MIN_COLUMN_WIDTH = 6
+INDENT = "   "
+NUMBER_WIDTH = 5
+GAP = "  "
+# Only the name columns are shrunk or clipped - IDs are always shown in full
+FITTED_COLUMNS = (0, 1)
+
+def clip(value, width):
+    """
+    Cuts a value down to fit its column, marking the cut with "...".
+
+    Args:
+        value (str): The text to fit
+        width (int): Column width
+
+    Returns:
+        str: The value, shortened if it was too long
+    """
+    if len(value) <= width:
+        return value
+    return value[:width - 3] + "..."
+
+def fit_widths(widths, max_width):
+    """
+    Shrinks the widest name column until a row fits in max_width characters.
+    Employee IDs and seniority are never shrunk - a clipped ID is useless.
+
+    Args:
+        widths (list): Current column widths (modified in place)
+        max_width (int): Terminal width to fit into
+    """
+    fixed = len(INDENT) + NUMBER_WIDTH + len(GAP) * len(widths)
+    while fixed + sum(widths) > max_width:
+        widest = max(FITTED_COLUMNS, key=lambda c: widths[c])
+        if widths[widest] <= MIN_COLUMN_WIDTH:
+            break  # Can't shrink any further - let the terminal wrap
+        widths[widest] -= 1
+
+def format_row(number, fields, widths, clipped=FITTED_COLUMNS):
+    """
+    Formats one aligned roster row (without the newline).
+    Columns in clipped are cut to their width; any other value that's too long
+    (like an ID) runs past its column instead.
+
+    Args:
+        number: Row number, or "#" for the header
+        fields (tuple): Column values
+        widths (list): Column widths
+        clipped (tuple): Indexes of the columns that may be clipped
+
+    Returns:
+        str: The aligned row
+    """
+    cells = [(clip(value, width) if c in clipped else value).ljust(width)
+             for c, (value, width) in enumerate(zip(fields, widths))]
+    return f"{INDENT}{number:>{NUMBER_WIDTH}}{GAP}{GAP.join(cells)}".rstrip()
+
+def render_roster(dept_name, records, out=None, chunk_size=DEFAULT_CHUNK_SIZE, max_width=None):
+    """
+    Writes a department roster as aligned columns, a chunk at a time.
+
+    Column widths are sized from the first chunk and stay fixed after the
+    header is written, so huge rosters never have to be held in memory just to
+    line things up. Longer names in later chunks are clipped to fit the line
+    width; longer IDs are printed in full and push the rest of their row over.
+
+    Columns are only fitted to a terminal. When out isn't one (a pager, a file,
+    a pipe) nothing is clipped unless max_width is given.
+
+    Args:
+        dept_name (str): Department name for the title
+        records: Iterable of employee records
+        out: Writable text stream (default: sys.stdout)
+        chunk_size (int): Rows formatted per write
+        max_width (int): Line width to fit (default: terminal width, or no limit
+                         when out isn't a terminal)
+
+    Returns:
+        int: Number of employees written
+    """
+    if out is None:
+        out = sys.stdout
+    if max_width is None and hasattr(out, "isatty") and out.isatty():
+        max_width = shutil.get_terminal_size((80, 24)).columns
+
+    # With no width limit there's no reason to cut anything short
+    clipped = FITTED_COLUMNS if max_width is not None else ()
+    widths = [len(h) for h in COLUMN_HEADERS]
+    widths[-1] = max(widths[-1], SENIORITY_WIDTH)
+    row_template = None
+    buffer = io.StringIO()
+    buffer.write(f"\nEmployee Roster for '{dept_name.title()}':\n")
+    buffer.write("=" * 60 + "\n")
+
+    total = 0
+    records = iter(records)
+    while True:
+        chunk = []
+        for record in records:
+            chunk.append(record)
+            if len(chunk) >= chunk_size:
+                break
+        if not chunk:
+            break
+
+        well_formed = [record for record in chunk if len(record) == len(widths)]
+        chunk_widths = [max(map(len, column)) for column in zip(*well_formed)]
+
+        if total == 0:
+            # First chunk sizes the columns; they're fixed once the header is out
+            for c, width in enumerate(chunk_widths):
+                widths[c] = max(widths[c], width)
+            if max_width is not None:
+                fit_widths(widths, max_width)
+            cells = GAP.join(f"{{:<{w}}}" for w in widths)
+            row_template = f"{INDENT}{{:>{NUMBER_WIDTH}}}{GAP}{cells}"
+            buffer.write(format_row("#", COLUMN_HEADERS, widths) + "\n")
+            buffer.write(format_row("-" * NUMBER_WIDTH, ["-" * w for w in widths], widths) + "\n")
+
+        # No name in this chunk needs clipping, so one format template handles every row
+        # (the template pads without truncating, so long IDs still come out whole)
+        fits = all(cw <= widths[c] for c, cw in enumerate(chunk_widths) if c in clipped)
+
+        for record in chunk:
+            total += 1
+            if len(record) != len(widths):
+                # Malformed line - show it as-is rather than hiding it
+                buffer.write(f"{INDENT}{total:>{NUMBER_WIDTH}}{GAP}{format_employee_line(record)}\n")
+            elif fits:
+                buffer.write(row_template.format(total, *record).rstrip() + "\n")
+            else:
+                buffer.write(format_row(total, record, widths, clipped) + "\n")
+
+        out.write(buffer.getvalue())
+        out.flush()
+        buffer = io.StringIO()
+
+    if total == 0:
+        buffer.write("   (No employees found in this department)\n")
+    buffer.write("=" * 60 + "\n")
+    buffer.write(f"   Total employees: {total}\n")
+    out.write(buffer.getvalue())
+    out.flush()
+    return total
+
+@contextmanager
+def pager_output(command=None):
+    """
+    Opens a pager (default: $PAGER, or "less") and yields its input stream.
+    Waits for the user to quit the pager before returning, and falls back to
+    stdout if the pager can't be started.
+
+    Args:
+        command (str): Pager command line (e.g., "less -S")
+
+    Yields:
+        file object: Text stream feeding the pager
+    """
+    command = command or os.environ.get("PAGER") or "less"
+    try:
+        proc = subprocess.Popen(shlex.split(command), stdin=subprocess.PIPE, text=True)
+    except OSError:
+        print(f"Pager '{command}' isn't available - showing the roster here instead.")
+        yield sys.stdout
+        return
+    try:
+        yield proc.stdin
+    finally:
+        try:
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass  # User quit the pager early - nothing left to flush
+        proc.wait()
@@ -0,0 +1,345 @@
+"""
+Storage backends for the Employee Roster Manager.
+
+Both backends expose the same small interface, so add_department() and
+view_department() don't care where the data actually lives:
+
+    department_exists(dept_name)        -> bool
+    save_department(dept_name, records) -> str (where the data went)
+    read_department(dept_name)          -> context manager yielding records
+    close()
+
+A record is a tuple of (FirstName, LastName, EmployeeID, SeniorityLevel).
+"""
+
+import os
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+import gzip
+import bz2
+import lzma
+
+try:
+    from compression import zstd  # Only ships with Python 3.14+
+except ImportError:
+    zstd = None
+
+# Compressed roster files are picked by extension, e.g. employees_sales.txt.gz
+# Each opener streams the data so we never decompress a whole file into memory.
+COMPRESSED_OPENERS = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+}
+if zstd is not None:
+    COMPRESSED_OPENERS[".zst"] = zstd.open
+
+def department_key(dept_name):
+    """
+    Normalizes a department name so lookups don't care about case or spacing.
+    
+    Args:
+        dept_name (str): The department name (e.g., "Human Resources")
+    
+    Returns:
+        str: Normalized key (e.g., "human_resources")
+    """
+    # Make it lowercase and replace spaces with underscores for safety
+    safe_name = dept_name.lower().replace(" ", "_")
+    # Remove any other potentially problematic characters
+    return "".join(c for c in safe_name if c.isalnum() or c == "_")
+
+def build_filename(dept_name):
+    """
+    Builds a safe filename from a department name.
+    Handles spaces and special characters so we don't break the filesystem.
+    
+    Args:
+        dept_name (str): The department name (e.g., "Human Resources")
+    
+    Returns:
+        str: Safe filename (e.g., "data/employees_human_resources.txt")
+    """
+    return f"data/employees_{department_key(dept_name)}.txt"
+
+def open_roster(filename, mode='r'):
+    """
+    Opens a roster file, plain or compressed, in text mode.
+    The extension decides the decompressor, so callers just iterate lines.
+    Always UTF-8, so a roster reads back the same whatever the format or locale.
+    
+    Args:
+        filename (str): Path to the roster file (e.g., "data/employees_sales.txt.gz")
+        mode (str): 'r' to read or 'w' to write (default: 'r')
+    
+    Returns:
+        file object: A text-mode file object that streams line by line
+    """
+    for ext, opener in COMPRESSED_OPENERS.items():
+        if filename.endswith(ext):
+            return opener(filename, mode + 't', encoding='utf-8')
+    return open(filename, mode, encoding='utf-8')
+
+def find_roster_file(dept_name):
+    """
+    Finds the file holding a department's roster, checking compressed variants too.
+    Plain .txt wins if somehow both exist.
+    
+    Args:
+        dept_name (str): The department name (e.g., "Sales")
+    
+    Returns:
+        str: Path to the existing roster file, or the plain .txt path if none exists
+    """
+    filename = build_filename(dept_name)
+    for candidate in [filename] + [filename + ext for ext in COMPRESSED_OPENERS]:
+        if os.path.exists(candidate):
+            return candidate
+    return filename
+
+
+def list_roster_files(data_dir="data"):
+    """
+    Lists every roster file in a data directory, plain or compressed.
+    
+    Args:
+        data_dir (str): Directory holding employees_*.txt files
+    
+    Returns:
+        list: (department_key, Path) tuples sorted by department
+    """
+    found = {}
+    suffixes = [".txt"] + [".txt" + ext for ext in COMPRESSED_OPENERS]
+    for path in sorted(Path(data_dir).glob("employees_*")):
+        for suffix in suffixes:
+            if path.name.endswith(suffix):
+                dept_key = path.name[len("employees_"):-len(suffix)]
+                # Plain .txt wins, matching find_roster_file()
+                if dept_key not in found or suffix == ".txt":
+                    found[dept_key] = path
+                break
+    return sorted(found.items())
+
+class DepartmentNotFoundError(FileNotFoundError):
+    """
+    Raised when a department doesn't exist in the storage backend.
+    Subclasses FileNotFoundError so callers handle both backends the same way.
+    """
+
+def parse_employee_line(line):
+    """
+    Splits a roster line into a record.
+    
+    Args:
+        line (str): A line like "John,Doe,E001,Senior"
+    
+    Returns:
+        tuple: The comma-separated fields, e.g. ("John", "Doe", "E001", "Senior")
+    """
+    return tuple(line.strip().split(","))
+
+def format_employee_line(record):
+    """
+    Turns a record back into a roster line (without the newline).
+    
+    Args:
+        record (tuple): Employee fields
+    
+    Returns:
+        str: Comma-separated line, e.g. "John,Doe,E001,Senior"
+    """
+    return ",".join(record)
+
+class TextFileStorage:
+    """
+    The original storage: one CSV-style text file per department in data/.
+    Compressed rosters (.gz, .bz2, .xz, .zst) are read transparently.
+    """
+
+    def department_exists(self, dept_name):
+        return os.path.exists(find_roster_file(dept_name))
+
+    def save_department(self, dept_name, records):
+        filename = build_filename(dept_name)
+        with open_roster(filename, 'w') as f:
+            for record in records:
+                f.write(format_employee_line(record) + "\n")
+        return filename
+
+    @contextmanager
+    def read_department(self, dept_name):
+        # open_roster raises FileNotFoundError right away if the file is missing
+        with open_roster(find_roster_file(dept_name)) as f:
+            yield (parse_employee_line(line) for line in f if line.strip())
+
+    def close(self):
+        pass  # Nothing held open between calls
+
+class SQLiteStorage:
+    """
+    Keeps every department in a single SQLite database.
+    One connection is opened up front and reused for the whole session,
+    and inserts are batched inside a single transaction per department.
+    """
+
+    BATCH_SIZE = 1000
+    BUSY_TIMEOUT = 30  # Seconds to wait for another writer to finish
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS departments (
+            id INTEGER PRIMARY KEY,
+            dept_key TEXT NOT NULL UNIQUE,
+            display_name TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS employees (
+            id INTEGER PRIMARY KEY,
+            department_id INTEGER NOT NULL REFERENCES departments(id),
+            position INTEGER NOT NULL,
+            first_name TEXT NOT NULL,
+            last_name TEXT NOT NULL,
+            employee_id TEXT NOT NULL,
+            seniority TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_employees_department
+            ON employees (department_id, position);
+        CREATE INDEX IF NOT EXISTS idx_employees_employee_id
+            ON employees (employee_id);
+        CREATE INDEX IF NOT EXISTS idx_employees_seniority
+            ON employees (seniority, department_id);
+    """
+
+    def __init__(self, db_path="data/roster.db"):
+        self.db_path = db_path
+        # Several sessions (or load-test workers) may share one database file.
+        # WAL lets readers and a writer run at once, and the timeout makes a
+        # second writer wait its turn instead of failing with "database is locked".
+        self.conn = sqlite3.connect(db_path, timeout=self.BUSY_TIMEOUT)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(self.SCHEMA)
+
+    def _department_id(self, dept_name):
+        row = self.conn.execute(
+            "SELECT id FROM departments WHERE dept_key = ?",
+            (department_key(dept_name),)
+        ).fetchone()
+        return row[0] if row else None
+
+    def department_exists(self, dept_name):
+        return self._department_id(dept_name) is not None
+
+    def save_department(self, dept_name, records):
+        # Everything in one transaction - either the whole department lands or none of it
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO departments (dept_key, display_name) VALUES (?, ?)",
+                (department_key(dept_name), dept_name)
+            )
+            dept_id = cursor.lastrowid
+            batch = []
+            for position, record in enumerate(records, 1):
+                if len(record) != 4:
+                    raise ValueError(f"Expected 4 fields, got {len(record)}: {record}")
+                batch.append((dept_id, position) + tuple(record))
+                if len(batch) >= self.BATCH_SIZE:
+                    self._insert_batch(batch)
+                    batch = []
+            if batch:
+                self._insert_batch(batch)
+        return f"{self.db_path} (department '{dept_name}')"
+
+    def _insert_batch(self, batch):
+        self.conn.executemany(
+            "INSERT INTO employees (department_id, position, first_name, last_name, "
+            "employee_id, seniority) VALUES (?, ?, ?, ?, ?, ?)",
+            batch
+        )
+
+    @contextmanager
+    def read_department(self, dept_name):
+        dept_id = self._department_id(dept_name)
+        if dept_id is None:
+            raise DepartmentNotFoundError(f"No department '{dept_name}' in {self.db_path}")
+        cursor = self.conn.execute(
+            "SELECT first_name, last_name, employee_id, seniority FROM employees "
+            "WHERE department_id = ? ORDER BY position",
+            (dept_id,)
+        )
+        try:
+            yield cursor  # Rows stream straight off the cursor
+        finally:
+            cursor.close()
+
+    def find_employee(self, employee_id):
+        """
+        Looks up an employee ID across every department.
+        
+        Returns:
+            list: (department, first, last, employee_id, seniority) tuples
+        """
+        return self.conn.execute(
+            "SELECT d.display_name, e.first_name, e.last_name, e.employee_id, e.seniority "
+            "FROM employees e JOIN departments d ON d.id = e.department_id "
+            "WHERE e.employee_id = ? ORDER BY d.display_name",
+            (employee_id,)
+        ).fetchall()
+
+    def count_by_department(self):
+        """
+        Returns:
+            list: (department, employee_count) tuples, sorted by department
+        """
+        return self.conn.execute(
+            "SELECT d.display_name, COUNT(e.id) FROM departments d "
+            "LEFT JOIN employees e ON e.department_id = d.id "
+            "GROUP BY d.id ORDER BY d.display_name"
+        ).fetchall()
+
+    def count_by_seniority(self, dept_name=None):
+        """
+        Counts employees per seniority level, optionally within one department.
+        
+        Returns:
+            list: (seniority, employee_count) tuples
+        """
+        if dept_name is None:
+            return self.conn.execute(
+                "SELECT seniority, COUNT(*) FROM employees GROUP BY seniority"
+            ).fetchall()
+        return self.conn.execute(
+            "SELECT seniority, COUNT(*) FROM employees WHERE department_id = ? "
+            "GROUP BY seniority",
+            (self._department_id(dept_name),)
+        ).fetchall()
+
+    def employees_with_seniority(self, seniority):
+        """
+        Returns:
+            list: (department, first, last, employee_id) tuples at the given level
+        """
+        return self.conn.execute(
+            "SELECT d.display_name, e.first_name, e.last_name, e.employee_id "
+            "FROM employees e JOIN departments d ON d.id = e.department_id "
+            "WHERE e.seniority = ? ORDER BY d.display_name, e.position",
+            (seniority,)
+        ).fetchall()
+
+    def close(self):
+        self.conn.close()
+
+def get_storage(backend="text", db_path="data/roster.db"):
+    """
+    Creates the storage backend by name.
+    
+    Args:
+        backend (str): "text" for the original flat files, or "sqlite"
+        db_path (str): Database path, only used by the sqlite backend
+    
+    Returns:
+        TextFileStorage or SQLiteStorage: The ready-to-use backend
+    """
+    if backend == "sqlite":
+        return SQLiteStorage(db_path)
+    if backend == "text":
+        return TextFileStorage()
+    raise ValueError(f"Unknown storage backend: {backend}")